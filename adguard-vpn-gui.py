@@ -8,6 +8,8 @@ import subprocess
 import re
 import os
 import shutil
+import weakref
+from operator import itemgetter
 
 # Fix for Wayland/Gnome environments
 os.environ["QT_QPA_PLATFORM"] = "xcb"
@@ -18,80 +20,166 @@ try:
         QPushButton, QComboBox, QLabel, QMessageBox, QDesktopWidget,
         QStyleFactory, QTextEdit, QDialog
     )
-    from PyQt5.QtCore import QThread, pyqtSignal, QTimer, Qt
-    from PyQt5.QtGui import QFont
+    from PyQt5.QtCore import (
+        QObject, QProcess, QProcessEnvironment, QRunnable, QThreadPool,
+        pyqtSignal, pyqtSlot, QTimer, Qt
+    )
+    from PyQt5.QtGui import QFont, QStandardItem, QStandardItemModel
 except ImportError:
     print("ERROR: PyQt5 library is not installed.")
     sys.exit(1)
 
+# DBus is optional: without it we rely on action callbacks and the backstop
+try:
+    from PyQt5.QtDBus import QDBusConnection
+except ImportError:
+    QDBusConnection = None
+
 BINARY_NAME = "adguardvpn-cli"
 USER_HOME = os.path.expanduser("~")
 
-# Find binary path
-BINARY_PATH = shutil.which(BINARY_NAME)
-if not BINARY_PATH:
-    POSSIBLE_PATHS = [
-        "/usr/bin/adguardvpn-cli",
-        "/usr/local/bin/adguardvpn-cli",
-        "/opt/adguardvpn/bin/adguardvpn-cli"
-    ]
-    for p in POSSIBLE_PATHS:
-        if os.path.exists(p):
-            BINARY_PATH = p
-            break
+# Ask the CLI for plain output so there is no ANSI to strip
+NO_COLOR_ENV = {"NO_COLOR": "1", "TERM": "dumb"}
+CLI_ENV = QProcessEnvironment.systemEnvironment()
+for _key, _value in NO_COLOR_ENV.items():
+    CLI_ENV.insert(_key, _value)
+
+# pkexec drops the session environment, pass the X11 bits explicitly
+PKEXEC_PREFIX = [
+    "pkexec", "env",
+    f"DISPLAY={os.environ.get('DISPLAY', ':0')}",
+    f"XAUTHORITY={os.environ.get('XAUTHORITY', '')}",
+    f"HOME={USER_HOME}",
+    *(f"{k}={v}" for k, v in NO_COLOR_ENV.items())
+]
+
+# Idle re-check interval; real updates come from actions and network events
+STATUS_BACKSTOP_MS = 30000
+# Delay before re-checking status so the CLI can settle after a change
+STATUS_SETTLE_MS = 1500
+# Kill a command (e.g. an abandoned pkexec prompt) after this many ms
+COMMAND_TIMEOUT_MS = 300000
+
+# Resolved off the GUI thread by BinaryLookup at startup
+BINARY_PATH = None
+# Install locations searched when the binary is not in PATH
+FALLBACK_DIRS = ["/usr/bin", "/usr/local/bin", "/opt/adguardvpn/bin"]
+
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# Location row: two-letter code, name, ping in ms
+_LOC_RE = re.compile(
+    r'^[ \t]*([A-Za-z]{2})[ \t]+(.+?)[ \t]+(\d+)[ \t]*\r?$', re.M
+)
+# Status lines, e.g. "Connected to FRANKFURT in TUN mode" / "VPN is disconnected"
+_STATUS_RE = re.compile(
+    r'(?:successfully[ \t]+)?connected[ \t]+to[ \t]+'
+    r'(?P<city>[^\n]+?)(?=[ \t]+in[ \t]|[ \t]*\r?$)'
+    r'|successfully[ \t]+connected|connected[ \t]+successfully',
+    re.I | re.M
+)
+_DISC_RE = re.compile(r'disconnected|vpn stopped', re.I)
 
 def clean_ansi(text):
-    """Remove ANSI escape sequences from text."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    """Remove ANSI escape sequences left despite NO_COLOR."""
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
+
+def find_binary():
+    """Return the full path of the CLI binary or None."""
+    return shutil.which(BINARY_NAME) or shutil.which(
+        BINARY_NAME, path=os.pathsep.join(FALLBACK_DIRS)
+    )
 
-class Worker(QThread):
-    """Background worker for running shell commands."""
+def weak_slot(method):
+    """Wrap a bound method so a signal connection doesn't keep its owner alive."""
+    ref = weakref.WeakMethod(method)
+
+    def slot(*args):
+        target = ref()
+        if target is not None:
+            target(*args)
+    return slot
+
+class CliProcess(QProcess):
+    """CLI command driven by the GUI event loop, no extra thread needed."""
+    done = pyqtSignal(bool, str)
+    progress = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # stderr is merged into stdout, like a terminal would show it
+        self.setProcessChannelMode(QProcess.MergedChannels)
+        self.setProcessEnvironment(CLI_ENV)
+        self.output = []
+        self.pending = b""
+
+        self.watchdog = QTimer(self)
+        self.watchdog.setSingleShot(True)
+        self.watchdog.setInterval(COMMAND_TIMEOUT_MS)
+        self.watchdog.timeout.connect(self.kill)
+
+        self.readyReadStandardOutput.connect(self.on_ready_read)
+        self.finished.connect(self.on_finished)
+        self.errorOccurred.connect(self.on_error)
+
+    def run(self, cmd, needs_root=False):
+        """Start cmd (argument list, argv[0] is the absolute binary path)."""
+        argv = PKEXEC_PREFIX + cmd if needs_root else cmd
+        self.output = []
+        self.pending = b""
+        self.start(argv[0], argv[1:])
+        self.watchdog.start()
+
+    def take_lines(self, data):
+        """Store and announce a block of output."""
+        if not data:
+            return
+        text = clean_ansi(data.decode(errors="replace"))
+        self.output.append(text)
+        self.progress.emit(text)
+
+    def on_ready_read(self):
+        """Collect newly available output."""
+        self.pending += bytes(self.readAllStandardOutput())
+        complete, sep, self.pending = self.pending.rpartition(b"\n")
+        self.take_lines(complete + sep)
+
+    def on_finished(self, exit_code, exit_status):
+        """Flush remaining output and report the result."""
+        self.watchdog.stop()
+        self.on_ready_read()
+        self.take_lines(self.pending)
+        self.pending = b""
+        full_output = "".join(self.output).strip()
+
+        if exit_status == QProcess.NormalExit and exit_code == 0:
+            self.done.emit(True, full_output)
+        elif "pkexec" in full_output and "dismissed" in full_output:
+            self.done.emit(False, "Отмена")
+        else:
+            self.done.emit(False, full_output)
+
+    def on_error(self, error):
+        """Report a command that could not be started."""
+        # Other errors are followed by finished(), this one is not
+        if error == QProcess.FailedToStart:
+            self.watchdog.stop()
+            self.done.emit(False, self.errorString())
+
+class LookupSignals(QObject):
+    """Signals emitted by BinaryLookup (QRunnable can't define its own)."""
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, cmd, needs_root=False):
+class BinaryLookup(QRunnable):
+    """Background job that locates the CLI binary."""
+    def __init__(self):
         super().__init__()
-        self.cmd = cmd
-        self.needs_root = needs_root
+        self.signals = LookupSignals()
 
     def run(self):
-        try:
-            cmd_exec = self.cmd
-            # Replace binary name with full path if available
-            if BINARY_PATH and BINARY_NAME in self.cmd and not self.cmd.startswith("/"):
-                cmd_exec = self.cmd.replace(BINARY_NAME, BINARY_PATH, 1)
-
-            if self.needs_root:
-                # Prepare environment for pkexec
-                display = os.environ.get('DISPLAY', ':0')
-                xauth = os.environ.get('XAUTHORITY', '')
-                env_str = f"DISPLAY={display} XAUTHORITY={xauth} HOME={USER_HOME}"
-                final_cmd = f"pkexec env {env_str} {cmd_exec}"
-            else:
-                final_cmd = cmd_exec
-
-            result = subprocess.run(
-                final_cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
-            )
-
-            stdout = clean_ansi(result.stdout).strip()
-            stderr = clean_ansi(result.stderr).strip()
-            full_output = stdout + "\n" + stderr
-
-            if result.returncode == 0:
-                self.finished.emit(True, full_output)
-            else:
-                if "pkexec" in full_output and "dismissed" in full_output:
-                    self.finished.emit(False, "Отмена")
-                else:
-                    self.finished.emit(False, full_output)
-        except Exception as e: # pylint: disable=broad-exception-caught
-            self.finished.emit(False, str(e))
+        path = find_binary()
+        self.signals.finished.emit(bool(path), path or "")
 
 class InstructionDialog(QDialog):
     """Dialog to show CLI commands to the user."""
@@ -125,26 +213,34 @@ class InstructionDialog(QDialog):
         cb.setText(self.cmd_box.toPlainText())
         QMessageBox.information(self, "Готово", "Скопировано!")
 
-class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
+class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """Main Application Window."""
     def __init__(self):
         super().__init__()
         self.current_city = None
         self.is_logged_in = False
-        self.w_login = None
-        self.w_status = None
-        self.w_act = None
+        self.locations = []
+        # Lowered display text -> combo row, rebuilt with the locations
+        self.combo_index = {}
+        self.w_lookup = None
+        self.p_login = None
+        self.p_act = None
+        # Last output applied by parse_and_apply_status
+        self.last_status_output = None
 
         self.init_ui()
         self.center()
+        self.show_checking_screen()
 
-        if not BINARY_PATH:
-            self.show_install_screen()
-        else:
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.check_status_routine)
-            self.timer.start(5000)
-            QTimer.singleShot(100, self.check_login)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(STATUS_BACKSTOP_MS)
+        self.timer.timeout.connect(self.check_status_routine)
+
+        # Status checks repeat all session long, reuse a single process
+        self.p_status = CliProcess(self)
+        self.p_status.done.connect(self.update_status_ui)
+        QTimer.singleShot(0, self.resolve_binary)
 
     def init_ui(self):
         """Initialize UI components."""
@@ -237,10 +333,47 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
             self.btn_disconnect.setEnabled(False)
             self.combo.setEnabled(True)
 
+    @staticmethod
+    def set_text(label, text):
+        """Set label text unless it is already shown."""
+        if label.text() != text:
+            label.setText(text)
+
+    @staticmethod
+    def set_style(label, qss):
+        """Apply a label stylesheet unless it is already set (restyling is costly)."""
+        if label.styleSheet() != qss:
+            label.setStyleSheet(qss)
+
+    def watch_network(self):
+        """Subscribe to NetworkManager state changes over DBus."""
+        if QDBusConnection is None:
+            return
+        QDBusConnection.systemBus().connect(
+            "org.freedesktop.NetworkManager",
+            "/org/freedesktop/NetworkManager",
+            "org.freedesktop.NetworkManager",
+            "StateChanged",
+            self.on_network_changed
+        )
+
+    @pyqtSlot("QDBusMessage")
+    def on_network_changed(self, _message):
+        """Re-check status once the network state has settled."""
+        QTimer.singleShot(STATUS_SETTLE_MS, self.check_status_routine)
+
+    def show_checking_screen(self):
+        """Show placeholder screen while the CLI binary is being located."""
+        self.set_text(self.status_label, "Проверка...")
+        self.set_style(self.status_label, "color: #555")
+        self.combo.hide()
+        self.btn_connect.hide()
+        self.btn_disconnect.hide()
+
     def show_install_screen(self):
         """Show installation required screen."""
-        self.status_label.setText("Программа не найдена")
-        self.status_label.setStyleSheet("color: #D32F2F")
+        self.set_text(self.status_label, "Программа не найдена")
+        self.set_style(self.status_label, "color: #D32F2F")
         self.combo.hide()
         self.clear_layout(self.control_layout)
         self.btn_login.hide()
@@ -249,8 +382,8 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
     def show_login_screen(self):
         """Show login required screen."""
         self.is_logged_in = False
-        self.status_label.setText("Не выполнен вход")
-        self.status_label.setStyleSheet("color: #E65100")
+        self.set_text(self.status_label, "Не выполнен вход")
+        self.set_style(self.status_label, "color: #E65100")
         self.combo.hide()
         self.btn_connect.hide()
         self.btn_disconnect.hide()
@@ -273,51 +406,87 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
             if item.widget():
                 item.widget().hide()
 
+    def run_dialog(self, dialog):
+        """Run a modal dialog with the status backstop paused."""
+        self.timer.stop()
+        dialog.exec_()
+        self.timer.start()
+
     def show_install_instruction(self):
         """Show installation instruction dialog."""
         cmd = (
             "curl -s https://raw.githubusercontent.com/AdguardTeam/"
             "AdGuardVPNCLI/master/scripts/install.sh | sh"
         )
-        InstructionDialog(
+        self.run_dialog(InstructionDialog(
             "Установка", "Выполните эту команду в терминале:", cmd
-        ).exec_()
+        ))
 
     def show_login_instruction(self):
         """Show login instruction dialog."""
         cmd = f"{BINARY_NAME} login"
-        InstructionDialog(
+        self.run_dialog(InstructionDialog(
             "Вход", "Откройте терминал и выполните команду входа:", cmd
-        ).exec_()
+        ))
+
+    def resolve_binary(self):
+        """Start background lookup of the CLI binary."""
+        self.w_lookup = BinaryLookup()
+        self.w_lookup.signals.finished.connect(weak_slot(self.on_binary_resolved))
+        QThreadPool.globalInstance().start(self.w_lookup)
+
+    def on_binary_resolved(self, found, path):
+        """Callback for binary lookup."""
+        global BINARY_PATH # pylint: disable=global-statement
+        self.release_worker("w_lookup")
+        if not found:
+            self.show_install_screen()
+            return
+        BINARY_PATH = path
+        self.watch_network()
+        self.check_login()
+
+    def release_worker(self, attr):
+        """Drop a finished job and schedule its QObject for deletion."""
+        worker = getattr(self, attr)
+        if worker is not None:
+            # Runnables carry their signals in a separate QObject
+            getattr(worker, "signals", worker).deleteLater()
+            setattr(self, attr, None)
 
     def check_login(self):
         """Start background check for login status."""
-        self.w_login = Worker(f"{BINARY_NAME} list-locations")
-        self.w_login.finished.connect(self.on_login_checked)
-        self.w_login.start()
+        self.locations = []
+        self.p_login = CliProcess(self)
+        self.p_login.progress.connect(self.parse_locations)
+        self.p_login.done.connect(self.on_login_checked)
+        self.p_login.run([BINARY_PATH, "list-locations"])
 
     def on_login_checked(self, success, output):
         """Callback for login check."""
+        self.release_worker("p_login")
         if not success and ("login" in output.lower() or "auth" in output.lower()):
             self.show_login_screen()
         else:
             self.show_main_screen()
             if success:
-                self.parse_locations(output)
+                self.fill_locations()
             self.check_status_routine()
 
     def check_status_routine(self):
-        """Periodic status check."""
+        """Status check triggered by actions, network events or backstop."""
         if not self.is_logged_in:
             return
+        if QApplication.activeModalWidget() is not None:
+            # Nobody is looking at the status, try again on the next backstop
+            self.timer.start()
+            return
         if "Ввод пароля" in self.status_label.text():
             return
-        if self.w_status and self.w_status.isRunning():
+        if self.p_status.state() != QProcess.NotRunning:
             return
 
-        self.w_status = Worker(f"{BINARY_NAME} status")
-        self.w_status.finished.connect(self.update_status_ui)
-        self.w_status.start()
+        self.p_status.run([BINARY_PATH, "status"])
 
     # pylint: disable=unused-argument
     def update_status_ui(self, success, output):
@@ -325,35 +494,30 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
         if not self.is_logged_in:
             return
         self.parse_and_apply_status(output)
+        # Re-arm the idle backstop after every completed check
+        self.timer.start()
 
     def parse_and_apply_status(self, output):
         """Parse status text and update UI."""
-        text = output.lower()
+        if output == self.last_status_output:
+            return
+        self.last_status_output = output
 
-        if "disconnected" in text or "vpn stopped" in text:
+        if _DISC_RE.search(output):
             if "DISCONNECTED" not in self.status_label.text():
-                self.status_label.setText("DISCONNECTED")
-                self.status_label.setStyleSheet("color: #D32F2F")
-                self.info_label.setText("Нет подключения")
+                self.set_text(self.status_label, "DISCONNECTED")
+                self.set_style(self.status_label, "color: #D32F2F")
+                self.set_text(self.info_label, "Нет подключения")
                 self.current_city = None
                 self.set_buttons_logic()
+        else:
+            m = _STATUS_RE.search(output)
+            if m and "CONNECTED" not in self.status_label.text():
+                self.set_text(self.status_label, "CONNECTED")
+                self.set_style(self.status_label, "color: #388E3C")
 
-        elif "connected" in text and ("successfully" in text or "to" in text):
-            if "CONNECTED" not in self.status_label.text():
-                self.status_label.setText("CONNECTED")
-                self.status_label.setStyleSheet("color: #388E3C")
-
-                city = "Неизвестно"
-                if "connected to" in text:
-                    parts = output.split("to ", 1)
-                    if len(parts) > 1:
-                        rest = parts[1]
-                        if " in " in rest:
-                            city = rest.split(" in ")[0].strip()
-                        else:
-                            city = rest.split("\n")[0].strip()
-
-                self.info_label.setText(f"Локация: {city}")
+                city = m.group("city") or "Неизвестно"
+                self.set_text(self.info_label, f"Локация: {city}")
                 self.current_city = city
                 self.set_buttons_logic()
 
@@ -361,29 +525,34 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
             self.combo.setEnabled(True)
 
     def parse_locations(self, output):
-        """Parse available locations and fill combo box."""
-        self.combo.clear()
-        locations = []
-        for line in output.split('\n'):
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            id_code = parts[0]
-            if len(id_code) != 2 or not id_code.isalpha():
-                continue
-            ping_str = parts[-1]
-            if not ping_str.isdigit():
-                continue
+        """Parse a chunk of location lines into self.locations."""
+        for m in _LOC_RE.finditer(output):
+            code, name, ping = m.group(1), m.group(2), int(m.group(3))
             # Store tuple: (ping, display_text, country_code)
-            locations.append((
-                int(ping_str),
-                f"[{ping_str} ms]  {' '.join(parts[1:-1])} ({id_code})",
-                id_code
+            self.locations.append((
+                ping,
+                f"[{ping} ms]  {' '.join(name.split())} ({code})",
+                code
             ))
 
-        locations.sort(key=lambda x: x[0])
-        for _, display, code in locations:
-            self.combo.addItem(display, code)
+    def fill_locations(self):
+        """Fill combo box with parsed locations sorted by ping."""
+        self.locations.sort(key=itemgetter(0))
+        # Build the whole model first so the view is updated only once
+        model = QStandardItemModel(len(self.locations), 1, self.combo)
+        for i, (_, display, code) in enumerate(self.locations):
+            item = QStandardItem(display)
+            # QComboBox.currentData() reads Qt.UserRole
+            item.setData(code, Qt.UserRole)
+            model.setItem(i, 0, item)
+
+        self.combo.setUpdatesEnabled(False)
+        self.combo.setModel(model)
+        self.combo.setUpdatesEnabled(True)
+        self.combo_index = {
+            display.lower(): i
+            for i, (_, display, _) in enumerate(self.locations)
+        }
 
         if self.current_city:
             self.select_combo_text(self.current_city)
@@ -397,13 +566,19 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
         if not text:
             return
         text = text.lower()
-        for i in range(self.combo.count()):
-            if text in self.combo.itemText(i).lower():
-                self.combo.setCurrentIndex(i)
+        idx = self.combo_index.get(text)
+        if idx is not None:
+            self.combo.setCurrentIndex(idx)
+            return
+        for key, idx in self.combo_index.items():
+            if text in key:
+                self.combo.setCurrentIndex(idx)
                 return
 
     def connect_vpn(self):
         """Initiate VPN connection."""
+        if not BINARY_PATH:
+            return
         code = self.combo.currentData()
         if not code:
             QMessageBox.warning(self, "Ошибка", "Выберите локацию из списка!")
@@ -412,33 +587,40 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
         self.btn_connect.setEnabled(False)
         self.btn_disconnect.setEnabled(False)
         self.combo.setEnabled(False)
-        self.status_label.setText("Ввод пароля...")
-        self.status_label.setStyleSheet("color: #555")
+        self.set_text(self.status_label, "Ввод пароля...")
+        self.set_style(self.status_label, "color: #555")
+        # The label no longer reflects the last status, force a re-apply
+        self.last_status_output = None
 
-        self.w_act = Worker(f"{BINARY_NAME} connect -l {code}", needs_root=True)
-        self.w_act.finished.connect(self.on_act_done)
-        self.w_act.start()
+        self.p_act = CliProcess(self)
+        self.p_act.done.connect(self.on_act_done)
+        self.p_act.run([BINARY_PATH, "connect", "-l", code], needs_root=True)
 
     def disconnect_vpn(self):
         """Initiate VPN disconnection."""
+        if not BINARY_PATH:
+            return
         self.btn_connect.setEnabled(False)
         self.btn_disconnect.setEnabled(False)
-        self.status_label.setText("Ввод пароля...")
-        self.status_label.setStyleSheet("color: #555")
+        self.set_text(self.status_label, "Ввод пароля...")
+        self.set_style(self.status_label, "color: #555")
+        # The label no longer reflects the last status, force a re-apply
+        self.last_status_output = None
 
-        self.w_act = Worker(f"{BINARY_NAME} disconnect", needs_root=True)
-        self.w_act.finished.connect(self.on_act_done)
-        self.w_act.start()
+        self.p_act = CliProcess(self)
+        self.p_act.done.connect(self.on_act_done)
+        self.p_act.run([BINARY_PATH, "disconnect"], needs_root=True)
 
     def on_act_done(self, success, output):
         """Callback for connect/disconnect action."""
+        self.release_worker("p_act")
         if success:
             self.parse_and_apply_status(output)
             # If status not parsed correctly, set temporary state
             if ("CONNECTED" not in self.status_label.text() and
                     "DISCONNECTED" not in self.status_label.text()):
-                self.status_label.setText("Проверка...")
-            QTimer.singleShot(1500, self.check_status_routine)
+                self.set_text(self.status_label, "Проверка...")
+            QTimer.singleShot(STATUS_SETTLE_MS, self.check_status_routine)
         else:
             if "Отмена" in output:
                 QMessageBox.information(self, "Отмена", "Ввод пароля отменен")
@@ -465,23 +647,17 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
             )
 
             if reply == QMessageBox.Yes:
-                cmd_exec = f"{BINARY_NAME} disconnect"
-                if BINARY_PATH:
-                    cmd_exec = cmd_exec.replace(BINARY_NAME, BINARY_PATH, 1)
-
-                display = os.environ.get('DISPLAY', ':0')
-                xauth = os.environ.get('XAUTHORITY', '')
-                env_str = f"DISPLAY={display} XAUTHORITY={xauth} HOME={USER_HOME}"
-                final_cmd = (
-                    f"nohup pkexec env {env_str} {cmd_exec} >/dev/null 2>&1 &"
-                )
+                argv = PKEXEC_PREFIX + [BINARY_PATH or BINARY_NAME, "disconnect"]
 
-                # Detached spawn to keep pkexec alive after exit
+                # Detached spawn in its own session keeps pkexec alive after exit
                 # pylint: disable=consider-using-with
                 subprocess.Popen(
-                    final_cmd,
-                    shell=True,
-                    start_new_session=True
+                    argv,
+                    start_new_session=True,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True
                 )
                 event.accept()
             elif reply == QMessageBox.No:
@@ -493,7 +669,8 @@ class AdGuardVPNGUI(QMainWindow): # pylint: disable=too-many-instance-attributes
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    app.setStyle(QStyleFactory.create("Fusion"))
     window = AdGuardVPNGUI()
     window.show()
+    # Style is applied once the window is up, before the first paint event
+    app.setStyle(QStyleFactory.create("Fusion"))
     sys.exit(app.exec_())